@@ -2,20 +2,45 @@ import asyncio
 import sys
 from pathlib import Path
 
+# uvloop gives a much faster event loop for the gateway and database sockets,
+# but it is not available on Windows
+loop_factory = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        pass
+
 from src.bot import Bot
 from src.config import settings
 from src.utils.logging import logger
 
-# Add this debug section
-logger.debug("Environment Check:")
-logger.debug(f"Database Session URL: {settings.database_session_url[:10]}...")
-logger.debug(f"Database Transaction URL: {settings.database_transaction_url[:10]}...")
-logger.debug(f"Database Direct URL: {settings.database_direct_url[:10]}...")
-logger.debug(f"Use Connection Pooling: {settings.use_connection_pooling}")
+def _log_environment_check() -> None:
+    """Debug-only startup summary, stripped when running under python -O."""
+    logger.debug("Environment Check:")
+    logger.debug(f"Database Session URL: {settings.database_session_url[:10]}...")
+    logger.debug(
+        f"Database Transaction URL: {settings.database_transaction_url[:10]}..."
+    )
+    logger.debug(f"Database Direct URL: {settings.database_direct_url[:10]}...")
+    logger.debug(f"Use Connection Pooling: {settings.use_connection_pooling}")
+
+
+def _handle_loop_exception(loop, context) -> None:
+    """Log unhandled task exceptions instead of letting asyncio swallow them."""
+    exception = context.get("exception")
+    if exception:
+        logger.error(f"Unhandled exception in task: {exception}", exc_info=exception)
+    else:
+        logger.error(f"Unhandled error in event loop: {context['message']}")
 
 
 async def main():
     try:
+        asyncio.get_running_loop().set_exception_handler(_handle_loop_exception)
+
         # Create and start the bot
         bot = Bot()
 
@@ -29,8 +54,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    if __debug__:
+        _log_environment_check()
+
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("Bot shutdown by user")
     except Exception as e:
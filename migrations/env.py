@@ -49,19 +49,38 @@ def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section)
     configuration["sqlalchemy.url"] = config.get_main_option("sqlalchemy.url")
 
+    # When migrations go through the Supabase pooler every NullPool checkout
+    # pays the full TCP+TLS+PgBouncer handshake, so keep a tiny real pool
+    # there and only fall back to NullPool for direct connections
+    url = configuration["sqlalchemy.url"]
+    if "pooler.supabase.com" in url or ":6543" in url:
+        pool_kwargs = {
+            "poolclass": pool.QueuePool,
+            "pool_size": 2,
+            "max_overflow": 0,
+            "pool_pre_ping": False,
+            "pool_recycle": 60,
+        }
+    else:
+        pool_kwargs = {"poolclass": pool.NullPool}
+
     # Create the engine without the statement cache settings
     connectable = engine_from_config(
         configuration,
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        **pool_kwargs,
     )
 
+    # Type/default comparison triggers extra per-column reflection queries,
+    # so only pay for it during `alembic revision --autogenerate`
+    autogenerating = bool(getattr(config.cmd_opts, "autogenerate", False))
+
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
-            compare_type=True,
-            compare_server_default=True,
+            compare_type=autogenerating,
+            compare_server_default=autogenerating,
         )
 
         with context.begin_transaction():
@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 from discord.ext import commands
 import logging
@@ -40,6 +42,19 @@ class Bot(commands.Bot):
             ),
         }
 
+    async def process_commands(self, message: discord.Message) -> None:
+        """Process commands, skipping messages that can't be commands"""
+        if message.author.bot:
+            return
+
+        # Skip the full context parse for messages that don't start with the
+        # command prefix - the vast majority of guild traffic
+        if not message.content.startswith(settings.discord_command_prefix):
+            return
+
+        ctx = await self.get_context(message)
+        await self.invoke(ctx)
+
     async def setup_hook(self) -> None:
         """Called when the bot is starting up"""
         try:
@@ -61,9 +76,15 @@ class Bot(commands.Bot):
             # Close storage connections
             await self.storage.close()
 
-            # Close LLM provider connections
-            for provider in self.llm_providers.values():
-                await provider.close()
+            # Close LLM provider connections concurrently; one flaky close
+            # shouldn't block or mask the others
+            results = await asyncio.gather(
+                *(provider.close() for provider in self.llm_providers.values()),
+                return_exceptions=True,
+            )
+            for name, result in zip(self.llm_providers, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error closing {name} provider: {str(result)}")
 
             await super().close()
             logger.info("Bot shutdown completed successfully")
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from urllib.parse import quote_plus
@@ -30,11 +30,14 @@ class Settings(BaseSettings):
     use_connection_pooling: bool = Field(True, env="USE_CONNECTION_POOLING")
 
     # Pooling Configuration
-    database_pool_size: int = 20
+    database_pool_size: int = 10
     database_max_overflow: int = 0  # Disabled when using Supabase pooler
     database_pool_timeout: int = 30
-    database_pool_pre_ping: bool = True
-    database_pool_recycle: int = 300
+    # pool_pre_ping issues a SELECT 1 that PgBouncer holds a transaction
+    # open for, so default it off and rely on a short pool_recycle for
+    # liveness when going through the transaction pooler
+    database_pool_pre_ping: bool = False
+    database_pool_recycle: int = 60
 
     # Redis Configuration
     redis_host: str
@@ -60,28 +63,30 @@ class Settings(BaseSettings):
             logger.critical(f"Failed to load configuration: {str(e)}")
             raise
 
-    @property
+    @cached_property
     def active_database_url(self) -> str:
-        """Returns the appropriate database URL based on pooling configuration"""
+        """Returns the appropriate database URL based on pooling configuration.
+
+        Computed once - engine creation and storage services read this
+        repeatedly, so keep string munging and logging out of the hot path.
+        """
         url = (
             self.database_transaction_url
             if self.use_connection_pooling
             else self.database_direct_url
         )
-        # Add debug logging
-        logger.debug(f"Raw database URL: {url}")
 
         # Ensure URL has correct protocol
         if not url.startswith("postgresql+asyncpg://"):
             if url.startswith("postgresql://"):
                 url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-                logger.debug(f"Updated database URL protocol: {url}")
             else:
                 logger.error(f"Unexpected database URL format: {url}")
 
+        logger.debug(f"Active database URL resolved: {url[:10]}...")
         return url
 
-    @property
+    @cached_property
     def pooling_kwargs(self) -> dict:
         """Returns SQLAlchemy pooling configuration"""
         if self.use_connection_pooling:
@@ -1,6 +1,8 @@
+import asyncio
 import os
+import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Set, Tuple
 import logging
 
 
@@ -8,7 +10,11 @@ class FeatureLoader:
     def __init__(self, bot, features_dir: str = "src/features"):
         self.bot = bot
         self.features_dir = Path(features_dir)
-        self.loaded_features: List[str] = []
+        # Set for O(1) membership checks and removal
+        self.loaded_features: Set[str] = set()
+        self._module_mtime: dict = {}
+        self._scan_cache: Optional[Tuple[int, List[str]]] = None
+        self._module_prefix = str(self.features_dir.parent) + os.sep
         self.logger = logging.getLogger(__name__)
 
     async def load_all_features(self) -> None:
@@ -17,44 +23,90 @@ class FeatureLoader:
             self.logger.warning(f"Features directory not found: {self.features_dir}")
             return
 
-        # Walk through all python files in features directory
-        for root, _, files in os.walk(self.features_dir):
-            for file in files:
-                # Only process python files
-                if file.endswith(".py"):
-                    feature_path = Path(root) / file
-                    module_path = self._get_module_path(feature_path)
-
-                    try:
-                        await self._load_feature(module_path)
-                    except Exception as e:
-                        self.logger.error(
-                            f"Failed to load feature {module_path}: {str(e)}"
-                        )
-
-    def _get_module_path(self, feature_path: Path) -> str:
+        # Load all discovered features concurrently - startup cost becomes
+        # the slowest single feature instead of the sum of all of them
+        module_paths = self._discover()
+        results = await asyncio.gather(
+            *(self._load_feature(module_path) for module_path in module_paths),
+            return_exceptions=True,
+        )
+        for module_path, result in zip(module_paths, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to load feature {module_path}: {str(result)}")
+
+    def _discover(self) -> List[str]:
+        """Returns module paths for all features, re-walking only when the
+        features directory mtime changes"""
+        mtime = self.features_dir.stat().st_mtime_ns
+        if self._scan_cache is not None and self._scan_cache[0] == mtime:
+            return self._scan_cache[1]
+
+        module_paths = [
+            self._get_module_path(feature_path)
+            for feature_path in self._iter_py(self.features_dir)
+        ]
+        self._scan_cache = (mtime, module_paths)
+        return module_paths
+
+    def _iter_py(self, root):
+        """Yields python file paths under root using scandir's cached entry types"""
+        # DirEntry.is_file/is_dir answer from the readdir buffer, avoiding
+        # the extra stat per entry that os.walk pays
+        for entry in os.scandir(root):
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._iter_py(entry.path)
+            elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+    def _get_module_path(self, feature_path: str) -> str:
         """Converts file path to module import path"""
-        relative_path = feature_path.relative_to(self.features_dir.parent)
-        # Convert path to module notation and remove .py
-        return str(relative_path).replace(os.sep, ".")[:-3]
+        # Plain string math - no Path allocation or relative_to walk needed
+        return feature_path.removeprefix(self._module_prefix).replace(os.sep, ".")[:-3]
 
     async def _load_feature(self, module_path: str) -> None:
         """Loads a single feature module"""
         try:
             await self.bot.load_extension(module_path)
-            self.loaded_features.append(module_path)
+            self.loaded_features.add(module_path)
+            self._module_mtime[module_path] = self._current_mtime(module_path)
             self.logger.info(f"Loaded feature: {module_path}")
         except Exception as e:
             self.logger.error(f"Error loading {module_path}: {str(e)}")
             raise e
 
+    def _current_mtime(self, module_path: str):
+        """Returns the source file mtime for a loaded module, if known"""
+        module = sys.modules.get(module_path)
+        source = getattr(module, "__file__", None) if module else None
+        if source is None:
+            return None
+        try:
+            return os.stat(source).st_mtime_ns
+        except OSError:
+            return None
+
     async def reload_all_features(self) -> None:
-        """Reloads all currently loaded features"""
-        for feature in self.loaded_features.copy():
-            try:
-                await self.bot.reload_extension(feature)
-                self.logger.info(f"Reloaded feature: {feature}")
-            except Exception as e:
-                self.logger.error(f"Error reloading {feature}: {str(e)}")
+        """Reloads all currently loaded features whose source changed"""
+        features = []
+        for feature in self.loaded_features:
+            # Skip the full extension reload when the module file is
+            # untouched - reloads re-run module-level init, which can be
+            # expensive for features holding HTTP clients
+            mtime = self._current_mtime(feature)
+            if mtime is not None and mtime == self._module_mtime.get(feature):
+                continue
+            features.append(feature)
+
+        results = await asyncio.gather(
+            *(self.bot.reload_extension(feature) for feature in features),
+            return_exceptions=True,
+        )
+        for feature, result in zip(features, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error reloading {feature}: {str(result)}")
                 # Remove from loaded features if reload fails
-                self.loaded_features.remove(feature)
+                self.loaded_features.discard(feature)
+                self._module_mtime.pop(feature, None)
+            else:
+                self._module_mtime[feature] = self._current_mtime(feature)
+                self.logger.info(f"Reloaded feature: {feature}")
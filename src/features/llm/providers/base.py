@@ -1,12 +1,13 @@
-from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union
 
 
-class BaseProvider(ABC):
+class BaseProvider:
+    """Plain base class - no ABC metaclass, providers just override
+    chat_completion. Keeps provider construction free of ABCMeta overhead."""
+
     def __init__(self, identifier: str = "default"):
         self.identifier = identifier
 
-    @abstractmethod
     async def chat_completion(
         self,
         messages: List[Dict[str, Any]],
@@ -16,4 +17,4 @@ class BaseProvider(ABC):
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         **kwargs,
     ) -> Dict[str, Any]:
-        pass
+        raise NotImplementedError
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from .base import BaseProvider
 from .groq import GroqProvider
 from .openai import OpenAIProvider
@@ -6,6 +6,31 @@ from .google import GoogleProvider
 
 
 class ProviderFactory:
+    # Memoized instances so repeat calls reuse the provider's HTTP client
+    # (and its keep-alive connections) instead of opening a new one
+    _cache: Dict[Tuple, BaseProvider] = {}
+
+    # Registry dispatch instead of an if/elif chain - adding a provider is
+    # a new entry here plus its default base URL
+    _builders = {
+        "groq": lambda api_key, identifier, base_url, **kwargs: GroqProvider(
+            api_key=api_key,
+            identifier=identifier,
+            base_url=base_url or "https://api.groq.com/openai/v1",
+        ),
+        "openai": lambda api_key, identifier, base_url, **kwargs: OpenAIProvider(
+            api_key=api_key,
+            identifier=identifier,
+            base_url=base_url or "https://api.openai.com/v1",
+            organization=kwargs.get("organization"),
+        ),
+        "google": lambda api_key, identifier, base_url, **kwargs: GoogleProvider(
+            api_key=api_key,
+            identifier=identifier,
+            base_url=base_url or "https://generativelanguage.googleapis.com/v1beta",
+        ),
+    }
+
     @classmethod
     def create_provider(
         cls,
@@ -34,34 +59,28 @@ class ProviderFactory:
         # Normalize provider name to lowercase for case-insensitive matching
         provider_name = provider_name.lower()
 
-        # Create provider instances based on name
-        if provider_name == "groq":
-            return GroqProvider(
-                api_key=api_key,
-                identifier=identifier,
-                base_url=base_url or "https://api.groq.com/openai/v1",
-            )
-        elif provider_name == "openai":
-            return OpenAIProvider(
-                api_key=api_key,
-                identifier=identifier,
-                base_url=base_url or "https://api.openai.com/v1",
-                organization=kwargs.get("organization"),
-            )
-        elif provider_name == "google":
-            return GoogleProvider(
-                api_key=api_key,
-                identifier=identifier,
-                base_url=base_url or "https://generativelanguage.googleapis.com/v1beta",
-            )
-        else:
-            # Update supported providers list
-            supported_providers = ["groq", "openai", "google"]
+        cache_key = (
+            provider_name,
+            api_key,
+            identifier,
+            base_url,
+            kwargs.get("organization"),
+        )
+        cached = cls._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        builder = cls._builders.get(provider_name)
+        if builder is None:
             raise ValueError(
                 f"Unsupported provider: {provider_name}. "
-                f"Supported providers are: {', '.join(supported_providers)}"
+                f"Supported providers are: {', '.join(cls._builders)}"
             )
 
+        provider = builder(api_key, identifier, base_url, **kwargs)
+        cls._cache[cache_key] = provider
+        return provider
+
     @classmethod
     def get_supported_providers(cls) -> list:
         """
@@ -70,4 +89,4 @@ class ProviderFactory:
         Returns:
             List of supported provider names
         """
-        return ["groq", "openai", "google"]
+        return list(cls._builders)
@@ -4,12 +4,22 @@ from .base import BaseProvider
 import logging
 from io import BytesIO
 import magic
+import random
 import time
 import asyncio
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
 
 logger = logging.getLogger(__name__)
 
+# One libmagic cookie for the module - magic.from_buffer would reload the
+# magic database on every call
+_MIME_MAGIC = magic.Magic(mime=True)
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff capped at 8s with jitter against retry storms."""
+    return min(8, 2**attempt) + random.uniform(0, 0.5)
+
 
 class GoogleProvider(BaseProvider):
     def __init__(
@@ -34,11 +44,13 @@ class GoogleProvider(BaseProvider):
     ) -> Dict[str, Any]:
         """Generate chat completion using Gemini."""
         try:
-            # Get the last user message
-            last_user_message = next(
-                (msg["content"] for msg in reversed(messages) if msg["role"] == "user"),
-                "",
-            )
+            # Get the last user message via a reverse-index loop - no
+            # generator frame per lookup
+            last_user_message = ""
+            for i in range(len(messages) - 1, -1, -1):
+                if messages[i]["role"] == "user":
+                    last_user_message = messages[i]["content"]
+                    break
 
             # Prepare content parts
             content_parts = [last_user_message]
@@ -52,16 +64,17 @@ class GoogleProvider(BaseProvider):
                         file_obj = BytesIO(file_data)
 
                         # Try to detect MIME type
-                        mime_type = magic.from_buffer(file_data, mime=True)
+                        mime_type = _MIME_MAGIC.from_buffer(file_data)
                         logger.info(f"Detected MIME type: {mime_type}")
 
                         # Upload the file with retries
                         max_retries = 3
-                        retry_delay = 2
                         for attempt in range(max_retries):
                             try:
-                                uploaded_file = genai.upload_file(
-                                    file_obj, mime_type=mime_type
+                                # genai calls are synchronous; keep them off
+                                # the event loop
+                                uploaded_file = await asyncio.to_thread(
+                                    genai.upload_file, file_obj, mime_type=mime_type
                                 )
                                 logger.info(f"File uploaded: {uploaded_file.name}")
                                 break
@@ -71,19 +84,25 @@ class GoogleProvider(BaseProvider):
                                 logger.warning(
                                     f"Upload attempt {attempt + 1} failed, retrying..."
                                 )
-                                await asyncio.sleep(retry_delay * (attempt + 1))
+                                await asyncio.sleep(_backoff(attempt))
                                 file_obj.seek(0)  # Reset file pointer for retry
 
                         # Handle processing state for certain file types
                         if mime_type in ["video/mp4", "application/pdf"]:
                             processing_timeout = 60  # 60 seconds timeout
                             start_time = time.time()
+                            poll = 0
                             while uploaded_file.state.name == "PROCESSING":
                                 if time.time() - start_time > processing_timeout:
                                     raise TimeoutError("File processing timeout")
                                 logger.info("Processing file...")
-                                await asyncio.sleep(5)
-                                uploaded_file = genai.get_file(uploaded_file.name)
+                                # Exponential backoff capped at 8s - quick
+                                # files finish fast, slow ones poll less
+                                await asyncio.sleep(min(8, 2**poll))
+                                poll += 1
+                                uploaded_file = await asyncio.to_thread(
+                                    genai.get_file, uploaded_file.name
+                                )
 
                         content_parts.append(uploaded_file)
                         logger.info("File processed successfully")
@@ -94,31 +113,33 @@ class GoogleProvider(BaseProvider):
                         # Don't continue with the request if file processing failed
                         raise
 
+            # Build the request objects once - retries only repeat the call
+            generation_config = genai.types.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens if max_tokens else None,
+            )
+
+            # Use vision model if there are files, otherwise use text model
+            model_to_use = self.vision_model if multimodal_input else self.model
+
+            # Set safety settings to block none, excluding unsupported categories
+            safety_settings = {
+                HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
+                HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
+                HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
+                HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
+            }
+
             # Generate content with retries
             max_retries = 3
-            retry_delay = 2
             last_error = None
 
             for attempt in range(max_retries):
                 try:
-                    generation_config = genai.types.GenerationConfig(
-                        temperature=temperature,
-                        max_output_tokens=max_tokens if max_tokens else None,
-                    )
-
-                    # Use vision model if there are files, otherwise use text model
-                    model_to_use = self.vision_model if multimodal_input else self.model
-
-                    # Set safety settings to block none, excluding unsupported categories
-                    safety_settings = {
-                        HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-                        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-                        HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-                        HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_LOW_AND_ABOVE,
-                    }
-
-                    # Generate the response
-                    response = model_to_use.generate_content(
+                    # Generate the response off the event loop - the genai
+                    # client is synchronous
+                    response = await asyncio.to_thread(
+                        model_to_use.generate_content,
                         content_parts,
                         generation_config=generation_config,
                         safety_settings=safety_settings,
@@ -135,7 +156,7 @@ class GoogleProvider(BaseProvider):
                     last_error = e
                     if attempt < max_retries - 1:
                         logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                        await asyncio.sleep(retry_delay * (attempt + 1))
+                        await asyncio.sleep(_backoff(attempt))
                         continue
                     else:
                         raise last_error
@@ -1,13 +1,26 @@
-import base64
+# pybase64 is API-compatible with stdlib base64 but uses SIMD codecs,
+# which matters for multi-megabyte image payloads
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+import asyncio
 import httpx
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, BinaryIO
 from .base import BaseProvider
 import logging
-import json
+import orjson
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps_pretty(obj: Any) -> str:
+    """orjson-backed pretty serializer for log output."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 class GroqProvider(BaseProvider):
     def __init__(
         self,
@@ -18,15 +31,27 @@ class GroqProvider(BaseProvider):
         super().__init__(identifier)
         self.api_key = api_key
         self.base_url = base_url
+        # One long-lived client: keep-alive + HTTP/2 multiplexing instead of
+        # a fresh TCP+TLS handshake per request
         self.client = httpx.AsyncClient(
-            base_url=self.base_url, headers={"Authorization": f"Bearer {self.api_key}"}
+            base_url=self.base_url,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60,
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0),
         )
+        # Frozen per-call header dict - no allocation per request
+        self._json_headers = {"Content-Type": "application/json"}
 
     @staticmethod
     def encode_image(image_path: str) -> str:
         """Encode a local image file to base64."""
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode("utf-8")
+            return base64.b64encode(image_file.read()).decode("ascii")
 
     def prepare_multimodal_content(
         self,
@@ -37,10 +62,11 @@ class GroqProvider(BaseProvider):
         """
         Prepare multimodal content, ensuring compatibility with Groq's API.
         """
-        # Extremely verbose logging
-        logger.info("=" * 50)
-        logger.info("MULTIMODAL CONTENT PREPARATION")
-        logger.info("=" * 50)
+        # Debug-grade dumps only - the formatting work (and the base64
+        # payloads it touches) is skipped entirely in production
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("MULTIMODAL CONTENT PREPARATION")
 
         # Validate inputs
         if multimodal_input is None:
@@ -51,31 +77,38 @@ class GroqProvider(BaseProvider):
         valid_images = []
         for i, img in enumerate(multimodal_input):
             try:
-                # Validate image is bytes and has content
-                if not isinstance(img, bytes):
+                # Producers that already hold base64 text (e.g. cached
+                # encodes) pass a str and skip the encode entirely
+                if isinstance(img, str):
+                    if not img:
+                        logger.error(f"Image {i} is empty")
+                        continue
+                    base64_image = img
+                elif isinstance(img, (bytes, memoryview)):
+                    if len(img) == 0:
+                        logger.error(f"Image {i} is empty")
+                        continue
+                    try:
+                        base64_image = base64.b64encode(img).decode("ascii")
+                    except Exception as encode_err:
+                        logger.error(
+                            f"Base64 encoding failed for image {i}: {str(encode_err)}"
+                        )
+                        continue
+                else:
                     logger.error(f"Image {i} is not bytes type: {type(img)}")
                     continue
 
-                if len(img) == 0:
-                    logger.error(f"Image {i} is empty")
-                    continue
-
-                # Attempt base64 encoding
-                try:
-                    base64_image = base64.b64encode(img).decode("utf-8")
-                    valid_images.append(
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
-                            },
-                        }
-                    )
-                    logger.info(f"Successfully processed image {i}")
-                except Exception as encode_err:
-                    logger.error(
-                        f"Base64 encoding failed for image {i}: {str(encode_err)}"
-                    )
+                valid_images.append(
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": "".join(("data:image/jpeg;base64,", base64_image))
+                        },
+                    }
+                )
+                if debug:
+                    logger.debug("Successfully processed image %d", i)
 
             except Exception as e:
                 logger.error(f"Error processing image {i}: {str(e)}")
@@ -91,10 +124,13 @@ class GroqProvider(BaseProvider):
         # Combine base content with images
         multimodal_content = base_content + valid_images
 
-        logger.info("Final multimodal content structure:")
-        logger.info(f"  Base content items: {len(base_content)}")
-        logger.info(f"  Image items: {len(valid_images)}")
-        logger.info(f"  Total items: {len(multimodal_content)}")
+        if debug:
+            logger.debug(
+                "Multimodal content: base=%d images=%d total=%d",
+                len(base_content),
+                len(valid_images),
+                len(multimodal_content),
+            )
 
         # Return multimodal content for vision models
         return multimodal_content
@@ -112,13 +148,14 @@ class GroqProvider(BaseProvider):
         Create a chat completion with Groq's API, supporting multimodal input.
         """
         try:
-            # Log input details with more verbosity
-            logger.info("Chat Completion Request:")
-            logger.info(f"Model: {model}")
-            logger.info(f"Number of messages: {len(messages)}")
-            logger.info(
-                f"Multimodal input count: {len(multimodal_input) if multimodal_input else 0}"
-            )
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(
+                    "Chat completion request: model=%s messages=%d multimodal=%d",
+                    model,
+                    len(messages),
+                    len(multimodal_input) if multimodal_input else 0,
+                )
 
             # Modify the last message to support multimodal content
             if messages and multimodal_input:
@@ -128,8 +165,11 @@ class GroqProvider(BaseProvider):
                 )
 
                 # Log the modified content in detail
-                logger.info("Modified message content:")
-                logger.info(json.dumps(last_message["content"], indent=2))
+                if debug:
+                    logger.debug(
+                        "Modified message content: %s",
+                        _dumps_pretty(last_message["content"]),
+                    )
 
             # Prepare payload with exact API specification
             payload = {
@@ -146,22 +186,23 @@ class GroqProvider(BaseProvider):
             payload.update(kwargs)
 
             # Log full payload
-            logger.info("Full API Payload:")
-            logger.info(json.dumps(payload, indent=2))
-
-            async with self.client as client:
-                response = await client.post(
-                    "/chat/completions",
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
+            if debug:
+                logger.debug("Full API payload: %s", _dumps_pretty(payload))
+
+            # Pre-serialize with orjson rather than letting httpx run the
+            # payload through stdlib json
+            response = await self.client.post(
+                "/chat/completions",
+                content=orjson.dumps(payload),
+                headers=self._json_headers,
+            )
 
-                # Log raw response
-                logger.info("Raw API Response:")
-                logger.info(response.text)
+            # Log raw response
+            if debug:
+                logger.debug("Raw API response: %s", response.text)
 
-                response.raise_for_status()
-                return response.json()
+            response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as http_err:
             logger.error(f"HTTP error occurred: {http_err}")
@@ -200,7 +241,10 @@ class GroqProvider(BaseProvider):
 
         # Handle file input
         if isinstance(file, str):
-            files["file"] = ("audio.mp3", open(file, "rb"))
+            # Read off the event loop with the handle closed afterwards;
+            # httpx's multipart encoder takes bytes content as-is
+            audio_bytes = await asyncio.to_thread(Path(file).read_bytes)
+            files["file"] = ("audio.mp3", audio_bytes)
         else:
             files["file"] = ("audio.mp3", file)
 
@@ -215,12 +259,9 @@ class GroqProvider(BaseProvider):
         if temperature is not None:
             data["temperature"] = temperature
 
-        async with self.client as client:
-            response = await client.post(
-                "/audio/transcriptions", data=data, files=files
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post("/audio/transcriptions", data=data, files=files)
+        response.raise_for_status()
+        return response.json()
 
     async def translate(
         self,
@@ -245,7 +286,8 @@ class GroqProvider(BaseProvider):
 
         # Handle file input
         if isinstance(file, str):
-            files["file"] = ("audio.mp3", open(file, "rb"))
+            audio_bytes = await asyncio.to_thread(Path(file).read_bytes)
+            files["file"] = ("audio.mp3", audio_bytes)
         else:
             files["file"] = ("audio.mp3", file)
 
@@ -258,43 +300,49 @@ class GroqProvider(BaseProvider):
         if temperature is not None:
             data["temperature"] = temperature
 
-        async with self.client as client:
-            response = await client.post("/audio/translations", data=data, files=files)
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post("/audio/translations", data=data, files=files)
+        response.raise_for_status()
+        return response.json()
 
     async def moderate(
         self,
         input: Union[str, List[str]],
         model: str = "llama-guard-3-8b",
-    ) -> Dict[str, Any]:
+        max_concurrency: int = 8,
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Check content against Groq's moderation model (llama-guard).
         The model automatically detects 14 harmful categories (S1-S14).
 
+        Each input is moderated as its own single-turn conversation -
+        llama-guard classifies one exchange at a time - and the requests
+        run concurrently over the shared keep-alive client, bounded by
+        max_concurrency.
+
         Args:
             input: String or list of strings to moderate
             model: Model to use for moderation (default: llama-guard-3-8b)
+            max_concurrency: Maximum in-flight moderation requests
 
         Returns:
-            Dict containing moderation results
+            Dict for a single string input, list of dicts for a list
         """
         try:
-            # Convert single string to list for consistent handling
-            if isinstance(input, str):
-                input = [input]
-
-            # Prepare messages for each input string
-            messages = [{"role": "user", "content": text} for text in input]
-
-            # Use chat completion with llama-guard model
-            response = await self.chat_completion(
-                messages=messages,
-                model=model,
-                temperature=0.0,  # Use deterministic output for moderation
-            )
+            single = isinstance(input, str)
+            texts = [input] if single else input
+
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _moderate_one(text: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.chat_completion(
+                        messages=[{"role": "user", "content": text}],
+                        model=model,
+                        temperature=0.0,  # Use deterministic output for moderation
+                    )
 
-            return response
+            results = await asyncio.gather(*(_moderate_one(text) for text in texts))
+            return results[0] if single else results
 
         except Exception as e:
             logger.error(f"Error in moderation: {str(e)}")
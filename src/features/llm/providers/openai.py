@@ -22,9 +22,12 @@ class OpenAIProvider(BaseProvider):
         if organization:
             headers["OpenAI-Organization"] = organization
 
+        # One long-lived client: keep-alive connections and TLS session reuse
+        # across requests instead of a fresh handshake per call
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
             headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
         )
 
     async def chat_completion(
@@ -47,10 +50,9 @@ class OpenAIProvider(BaseProvider):
             payload["tools"] = tools
             payload["tool_choice"] = tool_choice or "auto"
 
-        async with self.client as client:
-            response = await client.post("/chat/completions", json=payload)
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post("/chat/completions", json=payload)
+        response.raise_for_status()
+        return response.json()
 
     async def create_embeddings(
         self,
@@ -67,10 +69,9 @@ class OpenAIProvider(BaseProvider):
             **kwargs,
         }
 
-        async with self.client as client:
-            response = await client.post("/embeddings", json=payload)
-            response.raise_for_status()
-            return response.json()
+        response = await self.client.post("/embeddings", json=payload)
+        response.raise_for_status()
+        return response.json()
 
     async def close(self):
         """Close the HTTP client session."""
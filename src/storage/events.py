@@ -1,7 +1,8 @@
+import asyncio
+import time
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Optional
-from datetime import datetime, timezone
 
 
 class EventType(Enum):
@@ -13,14 +14,14 @@ class EventType(Enum):
     EXPIRE = "expire"
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageEvent:
     """Event data structure."""
 
     type: EventType
     key: str
     value: Optional[Any] = None
-    timestamp: datetime = datetime.now(timezone.utc)
+    timestamp: float = field(default_factory=time.time)
     metadata: Optional[dict] = None
 
 
@@ -32,17 +33,23 @@ class EventEmitter:
 
     async def emit(self, event: StorageEvent) -> None:
         """Emit an event to all registered handlers."""
-        if event.type in self._handlers:
-            for handler in self._handlers[event.type]:
-                await handler(event)
+        # Tuples are immutable snapshots, so handlers registered or removed
+        # mid-dispatch never mutate the sequence being iterated
+        handlers = self._handlers.get(event.type)
+        if not handlers:
+            return
+        if len(handlers) == 1:
+            await handlers[0](event)
+        else:
+            await asyncio.gather(*(handler(event) for handler in handlers))
 
     def on(self, event_type: EventType, handler: callable) -> None:
         """Register an event handler."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
 
     def off(self, event_type: EventType, handler: callable) -> None:
         """Remove an event handler."""
         if event_type in self._handlers:
-            self._handlers[event_type].remove(handler)
+            self._handlers[event_type] = tuple(
+                h for h in self._handlers[event_type] if h != handler
+            )
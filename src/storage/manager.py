@@ -23,8 +23,8 @@ class StorageManager:
         self.engine = None
         self.session_factory = None
         self._cache = None
-        self._database = None
-        self._hybrid = None
+        self._databases: Dict[Type[BaseModel], PostgresDatabaseService] = {}
+        self._hybrids: Dict[tuple, HybridStorageService] = {}
         logger.info("Initialized StorageManager")
 
     async def initialize(self) -> None:
@@ -34,7 +34,8 @@ class StorageManager:
             pool_settings = {
                 "pool_size": settings.database_pool_size,
                 "max_overflow": 0,  # Disable overflow for PgBouncer
-                "pool_pre_ping": True,
+                "pool_pre_ping": settings.database_pool_pre_ping,
+                "pool_recycle": settings.database_pool_recycle,
                 "pool_timeout": settings.database_pool_timeout,
                 "pool_use_lifo": True,
             }
@@ -82,12 +83,18 @@ class StorageManager:
         Returns:
             PostgresDatabaseService instance
         """
-        return PostgresDatabaseService(
-            url=settings.active_database_url,
-            model=model,
-            events=self.event_emitter,
-            **settings.pooling_kwargs,
-        )
+        # Reuse one service (and therefore one engine) per model - creating
+        # a fresh engine on every call duplicates connection pools
+        service = self._databases.get(model)
+        if service is None:
+            service = PostgresDatabaseService(
+                url=settings.active_database_url,
+                model=model,
+                events=self.event_emitter,
+                **settings.pooling_kwargs,
+            )
+            self._databases[model] = service
+        return service
 
     def get_hybrid(
         self, model: Type[BaseModel], ttl: Optional[int] = None
@@ -102,13 +109,17 @@ class StorageManager:
         Returns:
             HybridStorageService instance
         """
-        db_service = self.get_database(model)
-        return HybridStorageService(
-            cache_service=self._cache,
-            db_service=db_service,
-            default_ttl=ttl or settings.redis_conversation_ttl,
-            events=self.event_emitter,
-        )
+        cache_key = (model, ttl)
+        service = self._hybrids.get(cache_key)
+        if service is None:
+            service = HybridStorageService(
+                cache_service=self._cache,
+                db_service=self.get_database(model),
+                default_ttl=ttl or settings.redis_conversation_ttl,
+                events=self.event_emitter,
+            )
+            self._hybrids[cache_key] = service
+        return service
 
     @property
     def cache(self) -> RedisCacheService:
@@ -125,6 +136,11 @@ class StorageManager:
             if self._cache:
                 await self._cache.close()
 
+            for db_service in self._databases.values():
+                await db_service.close()
+            self._databases.clear()
+            self._hybrids.clear()
+
             if self.engine:
                 await self.engine.dispose()
 
@@ -17,8 +17,9 @@ class BaseRepository(Generic[T]):
     async def get(self, id: int) -> Optional[T]:
         """Get entity by ID."""
         try:
-            result = await self.session.execute(select(self.model).filter_by(id=id))
-            return result.scalar_one_or_none()
+            # session.get hits the identity map before emitting SQL, unlike
+            # the generic select path
+            return await self.session.get(self.model, id)
         except Exception as e:
             logger.error(f"Repository get error for id {id}: {str(e)}")
             return None
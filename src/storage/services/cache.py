@@ -1,4 +1,4 @@
-import json
+import orjson
 from typing import Any, Dict, Optional, TypeVar, List
 import redis.asyncio as redis
 from ..interfaces import CacheInterface
@@ -35,7 +35,7 @@ class RedisCacheService(CacheInterface[T]):
         """Get value from Redis."""
         try:
             value = await self.redis.get(self._key(key))
-            return json.loads(value) if value else None
+            return orjson.loads(value) if value else None
         except Exception as e:
             logger.error(f"Redis get error for key {key}: {str(e)}")
             return None
@@ -44,7 +44,7 @@ class RedisCacheService(CacheInterface[T]):
         """Set value in Redis with optional TTL."""
         try:
             key = self._key(key)
-            await self.redis.set(key, json.dumps(value), ex=ttl)
+            await self.redis.set(key, orjson.dumps(value), ex=ttl)
             await self.events.emit(
                 StorageEvent(type=EventType.CREATE, key=key, value=value)
             )
@@ -73,6 +73,36 @@ class RedisCacheService(CacheInterface[T]):
             logger.error(f"Redis exists error for key {key}: {str(e)}")
             return False
 
+    async def append_bounded(
+        self, key: str, item: T, max_len: int, ttl: Optional[int] = None
+    ) -> bool:
+        """Append item to a bounded list, trimming to max_len newest entries.
+
+        Backed by a single LPUSH+LTRIM(+EXPIRE) pipeline, so callers don't
+        have to read, mutate, and rewrite the whole list per append.
+        """
+        try:
+            key = self._key(key)
+            pipeline = self.redis.pipeline()
+            pipeline.lpush(key, orjson.dumps(item))
+            pipeline.ltrim(key, 0, max_len - 1)
+            if ttl:
+                pipeline.expire(key, ttl)
+            await pipeline.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis append_bounded error for key {key}: {str(e)}")
+            return False
+
+    async def get_list(self, key: str) -> List[T]:
+        """Get a bounded list's items, oldest first."""
+        try:
+            values = await self.redis.lrange(self._key(key), 0, -1)
+            return [orjson.loads(v) for v in reversed(values)]
+        except Exception as e:
+            logger.error(f"Redis get_list error for key {key}: {str(e)}")
+            return []
+
     async def get_pattern(self, pattern: str) -> Dict[str, T]:
         """Get all keys matching pattern."""
         try:
@@ -86,7 +116,7 @@ class RedisCacheService(CacheInterface[T]):
 
             values = await pipeline.execute()
             return {
-                k.removeprefix(self.prefix): json.loads(v)
+                k.removeprefix(self.prefix): orjson.loads(v)
                 for k, v in zip(keys, values)
                 if v is not None
             }
@@ -97,7 +127,7 @@ class RedisCacheService(CacheInterface[T]):
     async def publish(self, channel: str, message: Any) -> int:
         """Publish message to Redis channel."""
         try:
-            return await self.redis.publish(self._key(channel), json.dumps(message))
+            return await self.redis.publish(self._key(channel), orjson.dumps(message))
         except Exception as e:
             logger.error(f"Redis publish error for channel {channel}: {str(e)}")
             return 0
@@ -110,7 +140,7 @@ class RedisCacheService(CacheInterface[T]):
         try:
             async for message in pubsub.listen():
                 if message["type"] == "message":
-                    await callback(json.loads(message["data"]))
+                    await callback(orjson.loads(message["data"]))
         except Exception as e:
             logger.error(f"Redis subscribe error for channel {channel}: {str(e)}")
             await pubsub.unsubscribe(self._key(channel))
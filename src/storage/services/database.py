@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional, TypeVar, Union
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete
 from ..interfaces import DatabaseInterface
 from ..events import EventEmitter, EventType, StorageEvent
 from src.utils.logging import logger
@@ -40,7 +40,12 @@ class PostgresDatabaseService(DatabaseInterface[T]):
         try:
             async with self.async_session() as session:
                 async with session.begin():
-                    instance = await self.get(key)
+                    # Look up within this session - self.get would open a
+                    # second session (and a second pool checkout) per write
+                    result = await session.execute(
+                        select(self.model).filter_by(key=key)
+                    )
+                    instance = result.scalar_one_or_none()
                     if instance:
                         for k, v in value.__dict__.items():
                             if not k.startswith("_"):
@@ -112,6 +117,34 @@ class PostgresDatabaseService(DatabaseInterface[T]):
             logger.error(f"Database batch insert error: {str(e)}")
             return False
 
+    async def bulk_create(self, rows: List[Dict]) -> bool:
+        """Insert multiple rows in a single statement.
+
+        Uses the Core executemany form, which collapses N inserts into one
+        round-trip instead of a commit per row.
+        """
+        try:
+            async with self.async_session() as session:
+                async with session.begin():
+                    await session.execute(insert(self.model), rows)
+                    return True
+        except Exception as e:
+            logger.error(f"Database bulk create error: {str(e)}")
+            return False
+
+    async def bulk_delete(self, keys: List[str]) -> int:
+        """Delete all records whose key is in keys with one statement."""
+        try:
+            async with self.async_session() as session:
+                async with session.begin():
+                    result = await session.execute(
+                        delete(self.model).where(self.model.key.in_(keys))
+                    )
+                    return result.rowcount
+        except Exception as e:
+            logger.error(f"Database bulk delete error: {str(e)}")
+            return 0
+
     async def update_where(self, criteria: Dict, values: Dict) -> int:
         """Update records matching criteria."""
         try: